@@ -1,3 +1,5 @@
+import io
+import json
 import os
 import sys
 from pathlib import Path
@@ -16,10 +18,8 @@ import pandas as pd
 import requests
 import streamlit as st
 
-from src.recommender.recommendation_pipeline import (
-    recommend_by_mood,
-    recommend_similar_song,
-)
+# The recommender pipeline (pandas + sklearn + feature matrix) is imported
+# lazily inside _get_engine() so the first page paint is UI-only.
 
 # ---------------------------
 #  CONFIGURATION
@@ -192,6 +192,75 @@ st.markdown(
 # ---------------------------
 #  HELPERS
 # ---------------------------
+@st.cache_resource(show_spinner=False)
+def _get_engine():
+    """
+    Load the songs dataset and feature matrix once per server process and
+    share them as a singleton (st.cache_resource never pickles/copies, unlike
+    st.cache_data). Returns the pipeline module with its caches warmed.
+    """
+    from src.recommender import similarity_engine
+    from src.recommender import recommendation_pipeline
+
+    similarity_engine._get_songs_df()
+    similarity_engine._get_feature_matrix()
+    return recommendation_pipeline
+
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def _cached_by_mood(mood: str, n: int) -> pd.DataFrame:
+    """Cached wrapper so repeat clicks for the same (mood, n) skip the engine."""
+    return _get_engine().recommend_by_mood(mood, n=n)
+
+
+@st.cache_data(ttl=24 * 60 * 60, show_spinner=False)
+def _cached_similar(track_id: str, n: int) -> pd.DataFrame:
+    """Cached wrapper so repeat lookups of the same (track_id, n) skip the engine."""
+    return _get_engine().recommend_similar_song(track_id, n=n)
+
+
+@st.cache_resource(show_spinner=False)
+def _audio_index() -> set[str]:
+    """One cached directory scan instead of a stat() syscall per row per rerender."""
+    if not AUDIO_DIR.is_dir():
+        return set()
+    return {p.stem for p in AUDIO_DIR.glob("*.mp3")}
+
+
+@st.cache_data(show_spinner=False)
+def _recs_to_df(recs_json: str) -> pd.DataFrame:
+    """
+    Build a DataFrame from a backend recommendation payload. Keyed on the raw
+    JSON string so identical responses don't rebuild the frame, and parsed
+    with pandas' C JSON reader instead of DataFrame(list_of_dicts).
+    """
+    return pd.read_json(io.StringIO(recs_json), orient="records")
+
+
+def _display_slice(recs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Trim recommendations to the columns we actually render. Artists repeat a
+    lot, so a categorical dtype shrinks the Arrow payload Streamlit ships to
+    the browser (dictionary-encoded instead of one string per row).
+    """
+    display_cols = [
+        c
+        for c in ["track_name", "track_artist", "similarity", "explanation"]
+        if c in recs.columns
+    ]
+    out = recs.loc[:, display_cols].copy()
+    if "track_artist" in out.columns:
+        out["track_artist"] = out["track_artist"].astype("category")
+    return out
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _read_audio_bytes(path: str) -> bytes:
+    """Serve preview MP3 bytes from cache instead of re-reading on every rerun."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
 def render_audio_preview_from_df(df: pd.DataFrame) -> None:
     """
     If the dataframe has a track_id column and local demo audio files exist
@@ -201,14 +270,17 @@ def render_audio_preview_from_df(df: pd.DataFrame) -> None:
     if df is None or df.empty or "track_id" not in df.columns:
         return
 
-    # Build list of rows that have a matching local audio file
-    available = []
-    for _, row in df.iterrows():
-        track_id = str(row["track_id"])
-        audio_path = AUDIO_DIR / f"{track_id}.mp3"
-        if audio_path.exists():
-            label = f"{row.get('track_name', 'Unknown')} – {row.get('track_artist', '')}"
-            available.append((label, audio_path))
+    # Build list of rows that have a matching local audio file.
+    # Plain column zips avoid iterrows(), which boxes a Series per row.
+    idx = _audio_index()
+    track_ids = df["track_id"].astype(str)
+    names = df["track_name"] if "track_name" in df.columns else pd.Series("Unknown", index=df.index)
+    artists = df["track_artist"] if "track_artist" in df.columns else pd.Series("", index=df.index)
+    available = [
+        (f"{name} – {artist}", AUDIO_DIR / f"{tid}.mp3")
+        for tid, name, artist in zip(track_ids, names, artists)
+        if tid in idx
+    ]
 
     st.markdown("##### 🎧 Preview a track (demo)")
 
@@ -221,16 +293,17 @@ def render_audio_preview_from_df(df: pd.DataFrame) -> None:
         return
 
     labels = [lbl for lbl, _ in available]
+    # hash_pandas_object runs in C over raw buffers — much cheaper than the
+    # previous df.head().to_csv() serialization just to derive a widget key.
+    widget_key = hash(pd.util.hash_pandas_object(df["track_id"].head(), index=False).values.tobytes())
     choice = st.selectbox(
         "Choose a track to play",
         labels,
-        key=f"preview_{hash(df.head().to_csv())}",
+        key=f"preview_{widget_key}",
     )
 
     chosen_path = dict(available)[choice]
-    with open(chosen_path, "rb") as f:
-        audio_bytes = f.read()
-    st.audio(audio_bytes, format="audio/mp3")
+    st.audio(_read_audio_bytes(str(chosen_path)), format="audio/mp3")
 
 
 def call_backend_text(payload: dict) -> dict:
@@ -267,18 +340,14 @@ with tab_mood:
     if st.button("Generate playlist", key="btn_mood"):
         with st.spinner("Finding tracks that match this mood..."):
             try:
-                recs = recommend_by_mood(selected_mood, n=num_songs)
+                recs = _cached_by_mood(selected_mood, num_songs)
                 if recs is None or len(recs) == 0:
                     st.warning("No songs found for this mood.")
                 else:
                     st.success(f"Top {len(recs)} songs for mood: **{selected_mood}**")
 
-                    display_cols = [
-                        c
-                        for c in ["track_name", "track_artist", "similarity", "explanation"]
-                        if c in recs.columns
-                    ]
-                    st.dataframe(recs[display_cols], use_container_width=True)
+                    # Bound the Arrow payload even if the pipeline returns extra rows
+                    st.dataframe(_display_slice(recs).head(num_songs), use_container_width=True)
 
                     # Optional local audio preview
                     render_audio_preview_from_df(recs)
@@ -318,7 +387,7 @@ with tab_text:
 
                     recs = data.get("recommendations", [])
                     if recs:
-                        df = pd.DataFrame(recs)
+                        df = _recs_to_df(json.dumps(recs))
                         st.write("Playlist suggestion")
                         st.dataframe(df, use_container_width=True)
                     else:
@@ -363,7 +432,7 @@ with tab_voice:
 
                     recs = data.get("recommendations", [])
                     if recs:
-                        df = pd.DataFrame(recs)
+                        df = _recs_to_df(json.dumps(recs))
                         st.write("Playlist suggestion")
                         st.dataframe(df, use_container_width=True)
                     else:
@@ -392,17 +461,12 @@ with tab_similar:
         else:
             with st.spinner("Searching for similar songs..."):
                 try:
-                    recs = recommend_similar_song(track_id_input.strip(), n=num_songs)
+                    recs = _cached_similar(track_id_input.strip(), num_songs)
                     if recs is None or len(recs) == 0:
                         st.warning("No similar songs found.")
                     else:
                         st.success("Here are some similar tracks:")
-                        display_cols = [
-                            c
-                            for c in ["track_name", "track_artist", "similarity", "explanation"]
-                            if c in recs.columns
-                        ]
-                        st.dataframe(recs[display_cols], use_container_width=True)
+                        st.dataframe(_display_slice(recs).head(num_songs), use_container_width=True)
 
                         render_audio_preview_from_df(recs)
                 except Exception as e:
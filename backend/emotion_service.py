@@ -3,8 +3,9 @@ import time
 import json
 from typing import Dict, List, Tuple
 import asyncio
-import requests
+import httpx
 import logging
+import orjson
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -23,6 +24,16 @@ class EmotionDetectionService:
         if not logging.getLogger().handlers:
             # Basic logging configuration when not configured by the app
             logging.basicConfig(level=logging.INFO)
+        # Persistent client so the polling loop reuses one keep-alive
+        # connection instead of paying a TCP+TLS handshake per poll.
+        self._client = httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=4),
+        )
+        # Conditional-GET state for job polling: most polls return the same
+        # "IN_PROGRESS" body, so a 304 saves the response bytes entirely.
+        self._last_etag: Dict[str, str] = {}
+        self._last_job_body: Dict[str, dict] = {}
     
     def _get_api_key(self) -> str:
         """Get Hume API key from environment variable. Returns None if not set."""
@@ -32,9 +43,10 @@ class EmotionDetectionService:
             return None
         return api_key
     
-    def _start_job_from_local_file(self, audio_path: str) -> str:
+    async def _start_job_from_stream(self, fileobj, filename: str) -> str:
         """
-        Start a batch inference job from a local file
+        Start a batch inference job from an open file-like object, so uploads
+        can be relayed straight to Hume without an intermediate temp file.
         """
         url = BASE_URL
         headers = {
@@ -47,15 +59,14 @@ class EmotionDetectionService:
             }
         }
 
-        with open(audio_path, "rb") as f:
-            files = {
-                "file": (os.path.basename(audio_path), f, "application/octet-stream")
-            }
-            data = {
-                "json": json.dumps(job_config)
-            }
+        files = {
+            "file": (filename, fileobj, "application/octet-stream")
+        }
+        data = {
+            "json": orjson.dumps(job_config).decode()
+        }
 
-            resp = requests.post(url, headers=headers, data=data, files=files)
+        resp = await self._client.post(url, headers=headers, data=data, files=files)
 
         if resp.status_code >= 400:
             try:
@@ -70,27 +81,39 @@ class EmotionDetectionService:
             raise RuntimeError(f"No job_id in response: {body}")
         return job_id
 
-    def _get_job_details(self, job_id: str) -> dict:
+    async def _get_job_details(self, job_id: str) -> dict:
         """Get job details (state, status)"""
         url = f"{BASE_URL}/{job_id}"
         headers = {
             "X-Hume-Api-Key": self.api_key,
             "accept": "application/json; charset=utf-8",
         }
-        resp = requests.get(url, headers=headers)
+        etag = self._last_etag.get(job_id)
+        if etag:
+            headers["If-None-Match"] = etag
+        resp = await self._client.get(url, headers=headers)
+        if resp.status_code == 304 and job_id in self._last_job_body:
+            return self._last_job_body[job_id]
         resp.raise_for_status()
-        return resp.json()
+        body = resp.json()
+        new_etag = resp.headers.get("ETag")
+        if new_etag:
+            self._last_etag[job_id] = new_etag
+            self._last_job_body[job_id] = body
+        return body
 
-    def _get_job_predictions(self, job_id: str) -> list:
+    async def _get_job_predictions(self, job_id: str) -> list:
         """Get job predictions"""
         url = f"{BASE_URL}/{job_id}/predictions"
         headers = {
             "X-Hume-Api-Key": self.api_key,
             "accept": "application/json; charset=utf-8",
         }
-        resp = requests.get(url, headers=headers)
+        resp = await self._client.get(url, headers=headers)
         resp.raise_for_status()
-        return resp.json()
+        # Prediction payloads are large (thousands of emotion floats);
+        # orjson parses them several times faster than stdlib json.
+        return orjson.loads(resp.content)
 
     def _extract_emotions_from_prosody(self, predictions: list) -> List[Tuple[str, float]]:
         """
@@ -98,36 +121,46 @@ class EmotionDetectionService:
         """
         all_emotions: Dict[str, float] = {}
 
-        for source_entry in predictions:
-            results = source_entry.get("results", {})
-            preds = results.get("predictions", [])
-            for pred in preds:
-                models = pred.get("models", {})
-                prosody = models.get("prosody")
-                if not prosody:
-                    continue
-
-                grouped = prosody.get("grouped_predictions", [])
-                for group in grouped:
-                    for p in group.get("predictions", []):
-                        for emo in p.get("emotions", []):
-                            name = emo.get("name")
-                            score = emo.get("score", 0.0)
-                            if not name:
-                                continue
-                            if name not in all_emotions or score > all_emotions[name]:
-                                all_emotions[name] = score
+        # Flatten the 5-level nesting into one generator so the hot loop does
+        # a single dict update per emotion instead of nested method lookups.
+        flat = (
+            (emo.get("name"), emo.get("score", 0.0))
+            for source_entry in predictions
+            for pred in source_entry.get("results", {}).get("predictions", [])
+            for group in (pred.get("models", {}).get("prosody") or {}).get("grouped_predictions", [])
+            for p in group.get("predictions", [])
+            for emo in p.get("emotions", [])
+        )
+        get = all_emotions.get
+        for name, score in flat:
+            if name and score > get(name, -1.0):
+                all_emotions[name] = score
 
         return sorted(all_emotions.items(), key=lambda x: x[1], reverse=True)
 
     async def analyze_audio(self, audio_path: str, max_wait_time: int = 120) -> List[dict]:
         """
         Analyze audio file and return emotion predictions
-        
+
         Args:
             audio_path: Path to the audio file
             max_wait_time: Maximum time to wait for job completion (seconds)
-            
+
+        Returns:
+            List of emotion dictionaries with 'name' and 'score' keys
+        """
+        with open(audio_path, "rb") as f:
+            return await self.analyze_audio_stream(f, os.path.basename(audio_path), max_wait_time)
+
+    async def analyze_audio_stream(self, fileobj, filename: str, max_wait_time: int = 120) -> List[dict]:
+        """
+        Analyze audio from an open file-like object and return emotion predictions
+
+        Args:
+            fileobj: Binary file-like object positioned at the start of the audio
+            filename: Original filename (used in the multipart upload)
+            max_wait_time: Maximum time to wait for job completion (seconds)
+
         Returns:
             List of emotion dictionaries with 'name' and 'score' keys
         """
@@ -137,12 +170,14 @@ class EmotionDetectionService:
             raise RuntimeError("HUME API key not configured")
 
         # Start the job
-        job_id = self._start_job_from_local_file(audio_path)
-
-        # Poll for completion
-        max_attempts = max_wait_time // 3
-        for attempt in range(max_attempts):
-            job = self._get_job_details(job_id)
+        job_id = await self._start_job_from_stream(fileobj, filename)
+
+        # Poll for completion with exponential backoff: quick jobs are caught
+        # within ~1s, long jobs stop hammering the API with constant polls.
+        delay = 1.0
+        elapsed = 0.0
+        while True:
+            job = await self._get_job_details(job_id)
             state = job.get("state", {})
             status = state.get("status")
 
@@ -150,14 +185,20 @@ class EmotionDetectionService:
                 break
             if status == "FAILED":
                 raise RuntimeError(f"Job failed: {json.dumps(job, indent=2)}")
+            if elapsed >= max_wait_time:
+                raise RuntimeError("Timed out waiting for job to complete")
 
             # Wait before next check
-            await asyncio.sleep(3)
-        else:
-            raise RuntimeError("Timed out waiting for job to complete")
+            await asyncio.sleep(delay)
+            elapsed += delay
+            delay = min(delay * 1.5, 10.0)
+
+        # Drop conditional-GET state for the finished job
+        self._last_etag.pop(job_id, None)
+        self._last_job_body.pop(job_id, None)
 
         # Get predictions
-        predictions = self._get_job_predictions(job_id)
+        predictions = await self._get_job_predictions(job_id)
         emotions_tuple = self._extract_emotions_from_prosody(predictions)
 
         if not emotions_tuple:
@@ -1,23 +1,56 @@
+import asyncio
 import os
-import tempfile
+import re
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, Request, UploadFile, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
 import uvicorn
 
 from backend.emotion_service import EmotionDetectionService
-from backend.recommender_service import get_recommendations, get_similar_songs_by_name, get_song_by_track_id, get_similar_songs_by_track_id
+from backend.recommender_service import (
+    get_recommendations,
+    get_similar_songs_by_name,
+    get_song_by_track_id,
+    get_similar_songs_by_track_id,
+    get_supported_moods,
+    _cached_mood_records,
+)
+from src.recommender.similarity_engine import _get_songs_df
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """
+    Build the emotion service after worker start (not at module import, which
+    runs pre-fork under multi-worker uvicorn and would duplicate the HTTP
+    client setup per worker), then warm the recommender: load the songs
+    dataset and run one recommendation per supported mood so the first user
+    request doesn't pay the CSV-load/feature-build cost. This also
+    pre-populates the per-mood memoization cache.
+    """
+    app.state.emotion_service = EmotionDetectionService()
+    _get_songs_df()
+    for mood in get_supported_moods():
+        _cached_mood_records(mood, 10)
+    yield
+
 
 app = FastAPI(
     title="Emotune Recommender API",
     description="Music recommendation system based on emotional analysis of text and audio",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes the emotion/recommendation payloads several times
+    # faster than the default stdlib-json response class
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
 )
 
 # CORS middleware for frontend integration
@@ -29,8 +62,88 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize emotion detection service
-emotion_service = EmotionDetectionService()
+# --------------------------------------------------------------------
+# Text-mood keyword heuristic, compiled once into a single regex so each
+# request does one scan over the text instead of nine any(word in txt ...)
+# passes. List order preserves the original branch priority.
+# --------------------------------------------------------------------
+_MOOD_KEYWORDS = [
+    ("Joy", ["happy", "joy", "glad", "excited", "elated", "great", "amazing", "awesome"]),
+    ("Sadness", ["sad", "depressed", "unhappy", "down", "lonely", "heartbroken", "crying"]),
+    ("Anger", ["angry", "mad", "furious", "annoyed", "frustrated", "pissed"]),
+    ("Fear", ["scared", "afraid", "fear", "terrified", "anxious", "anxiety", "nervous", "panic", "panicking"]),
+    ("Concentration", ["study", "studying", "focus", "concentrate", "work", "working", "productive", "homework", "reading"]),
+    ("Calmness", ["chill", "relax", "relaxing", "calm", "peaceful", "sleepy", "tired", "rest", "sleep", "wind down"]),
+    ("Excitement", ["energetic", "pump", "pumped", "workout", "exercise", "gym", "run", "running", "hype", "party"]),
+    ("Love", ["love", "romantic", "romance", "date", "crush", "heart"]),
+    ("Nostalgia", ["nostalgic", "nostalgia", "memories", "remember", "miss", "missing"]),
+]
+
+_MOOD_RE = re.compile(
+    "|".join(
+        rf"(?P<{name}>\b(?:{'|'.join(map(re.escape, words))})\b)"
+        for name, words in _MOOD_KEYWORDS
+    )
+)
+_MOOD_RANK = {name: i for i, (name, _) in enumerate(_MOOD_KEYWORDS)}
+
+# Accepted audio/video extensions, hoisted so the set isn't rebuilt per request
+_ALLOWED_EXTS = frozenset({'.mp3', '.m4a', '.wav', '.flac', '.aac', '.ogg', '.opus', '.wma', '.m4b', '.mp4'})
+
+# Upload size cap: reject oversize files before any bytes are relayed to Hume
+MAX_UPLOAD_BYTES = 25 * 1024 * 1024
+
+
+def _looks_like_audio(upload_file: UploadFile) -> bool:
+    """Accept if content_type indicates audio/video, else infer from the extension."""
+    if upload_file.content_type and upload_file.content_type.startswith(('audio/', 'video/')):
+        return True
+    if upload_file.filename:
+        fn = upload_file.filename.lower()
+        dot = fn.rfind('.')
+        if dot != -1 and fn[dot:] in _ALLOWED_EXTS:
+            return True
+    return False
+
+
+def _match_mood_label(txt: str) -> Optional[str]:
+    """Single-pass keyword match; returns the highest-priority emotion name."""
+    best = None
+    best_rank = len(_MOOD_RANK)
+    for m in _MOOD_RE.finditer(txt):
+        rank = _MOOD_RANK[m.lastgroup]
+        if rank < best_rank:
+            best, best_rank = m.lastgroup, rank
+            if rank == 0:
+                break
+    return best
+
+
+# Single-flight coalescing for recommendation lookups: concurrent requests
+# for the same emotion share one threadpool computation instead of each
+# running the pandas pipeline. Keyed the same way as the service-side cache.
+_inflight: dict = {}
+
+
+async def _get_recommendations_shared(top_emotion: str, emotions: List[dict]) -> List[dict]:
+    """Run get_recommendations in the threadpool, sharing in-flight results."""
+    key = (top_emotion or "").lower().strip()
+    fut = _inflight.get(key)
+    if fut is not None:
+        return await fut
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        result = await run_in_threadpool(get_recommendations, top_emotion, emotions)
+    except Exception as exc:
+        fut.set_exception(exc)
+        fut.exception()  # mark retrieved even if no duplicate caller awaits
+        raise
+    else:
+        fut.set_result(result)
+        return result
+    finally:
+        _inflight.pop(key, None)
 
 
 class TextRequest(BaseModel):
@@ -39,6 +152,10 @@ class TextRequest(BaseModel):
     mood: Optional[str] = None
 
 
+class BatchTextRequest(BaseModel):
+    items: List[TextRequest]
+
+
 class SimilarSongsRequest(BaseModel):
     song_name: str
     top_n: int = 10
@@ -87,8 +204,10 @@ async def root():
     }
 
 
-@app.post("/api/recommend/audio", response_model=RecommendationResponse)
-async def recommend_from_audio(file: UploadFile = File(...)):
+# responses= documents the schema in OpenAPI without re-validating every
+# server-constructed payload the way response_model= would.
+@app.post("/api/recommend/audio", responses={200: {"model": RecommendationResponse}})
+async def recommend_from_audio(request: Request, file: UploadFile = File(...)):
     """
     Upload an audio file to detect emotions using Hume AI prosody analysis,
     then get personalized song recommendations based on detected emotions.
@@ -100,76 +219,54 @@ async def recommend_from_audio(file: UploadFile = File(...)):
     4. Returns detected emotions and recommended songs
     """
     # Validate file type: accept if content_type indicates audio/video, or infer from filename extension
-    allowed_exts = {'.mp3', '.m4a', '.wav', '.flac', '.aac', '.ogg', '.opus', '.wma', '.m4b', '.mp4'}
-    def _looks_like_audio(upload_file: UploadFile) -> bool:
-        if upload_file.content_type and upload_file.content_type.startswith(('audio/', 'video/')):
-            return True
-        # Fallback: infer from filename extension
-        if upload_file.filename:
-            _, ext = os.path.splitext(upload_file.filename.lower())
-            if ext in allowed_exts:
-                return True
-        return False
-
     if not _looks_like_audio(file):
         raise HTTPException(
             status_code=400,
             detail="Invalid file type. Please upload an audio or video file. If using the OpenAPI docs, set the file's MIME to an audio type."
         )
-    
-    # Save uploaded file temporarily
-    suffix = os.path.splitext(file.filename)[1] if file.filename else ".tmp"
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
-        tmp_path = tmp_file.name
-    
-    try:
-        # Step 1: Analyze emotions using Hume AI
-        emotions = await emotion_service.analyze_audio(tmp_path)
-        
-        top_emotion = emotions[0]["name"]
-        top_score = emotions[0]["score"]
-        
-        # Step 2: Pass emotions to recommender system and get song recommendations
-        # TODO: Replace with actual recommender system integration
-        recommendations = get_recommendations(top_emotion, emotions)
-        
-        return RecommendationResponse(
-            emotions=emotions,
-            top_emotion=top_emotion,
-            top_score=top_score,
-            recommendations=recommendations
+
+    # Reject oversize uploads up front so we never read or relay the bytes
+    if file.size and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum upload size is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB."
         )
-    finally:
-        # Clean up temporary file
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+    
+    # Step 1: Analyze emotions using Hume AI. The upload (a spooled temp
+    # file managed by Starlette) is relayed straight to Hume — no extra
+    # disk write/read round trip.
+    emotions = await request.app.state.emotion_service.analyze_audio_stream(
+        file.file, file.filename or "upload.tmp"
+    )
 
+    top_emotion = emotions[0]["name"]
+    top_score = emotions[0]["score"]
 
-@app.post("/api/recommend/text", response_model=RecommendationResponse)
-async def recommend_from_text(request: TextRequest):
-    """
-    Analyze text to detect emotions, then get personalized song recommendations.
+    # Step 2: Pass emotions to recommender system and get song recommendations
+    recommendations = await _get_recommendations_shared(top_emotion, emotions)
 
-    Flow:
-    1. User submits text
-    2. Text is analyzed for emotions (heuristic for now)
-    3. Emotions are passed to the recommender system
-    4. Returns detected emotions and recommended songs
-    """
+    return {
+        "emotions": emotions,
+        "top_emotion": top_emotion,
+        "top_score": top_score,
+        "recommendations": recommendations,
+    }
+
+
+async def _handle_text_request(request: TextRequest) -> dict:
+    """Shared text → emotion → recommendations flow for the single and batch endpoints."""
     # If user provided a mood, use it directly for recommendations
     if request.mood:
         top_emotion = request.mood
         emotions = [{"name": top_emotion, "score": 1.0}]
-        recommendations = get_recommendations(top_emotion, emotions)
+        recommendations = await _get_recommendations_shared(top_emotion, emotions)
 
-        return RecommendationResponse(
-            emotions=emotions,
-            top_emotion=top_emotion,
-            top_score=1.0,
-            recommendations=recommendations
-        )
+        return {
+            "emotions": emotions,
+            "top_emotion": top_emotion,
+            "top_score": 1.0,
+            "recommendations": recommendations,
+        }
 
     if not request.text:
         raise HTTPException(status_code=400, detail="Either 'text' or 'mood' must be provided")
@@ -180,32 +277,17 @@ async def recommend_from_text(request: TextRequest):
     smalltalk = {"hi", "hey", "hello", "yo", "sup", "ok", "okay", "k", "kk", "test"}
     if txt in smalltalk or len(txt.split()) <= 1:
         emotions = [{"name": "Unknown", "score": 0.0}]
-        return RecommendationResponse(
-            emotions=emotions,
-            top_emotion="Unknown",
-            top_score=0.0,
-            recommendations=[]
-        )
+        return {
+            "emotions": emotions,
+            "top_emotion": "Unknown",
+            "top_score": 0.0,
+            "recommendations": [],
+        }
 
-    # Heuristic: look for common mood words in text
-    if any(word in txt for word in ["happy", "joy", "glad", "excited", "elated", "great", "amazing", "awesome"]):
-        emotions = [{"name": "Joy", "score": 0.9}]
-    elif any(word in txt for word in ["sad", "depressed", "unhappy", "down", "lonely", "heartbroken", "crying"]):
-        emotions = [{"name": "Sadness", "score": 0.9}]
-    elif any(word in txt for word in ["angry", "mad", "furious", "annoyed", "frustrated", "pissed"]):
-        emotions = [{"name": "Anger", "score": 0.9}]
-    elif any(word in txt for word in ["scared", "afraid", "fear", "terrified", "anxious", "anxiety", "nervous", "panic", "panicking"]):
-        emotions = [{"name": "Fear", "score": 0.9}]
-    elif any(word in txt for word in ["study", "studying", "focus", "concentrate", "work", "working", "productive", "homework", "reading"]):
-        emotions = [{"name": "Concentration", "score": 0.9}]
-    elif any(word in txt for word in ["chill", "relax", "relaxing", "calm", "peaceful", "sleepy", "tired", "rest", "sleep", "wind down"]):
-        emotions = [{"name": "Calmness", "score": 0.9}]
-    elif any(word in txt for word in ["energetic", "pump", "pumped", "workout", "exercise", "gym", "run", "running", "hype", "party"]):
-        emotions = [{"name": "Excitement", "score": 0.9}]
-    elif any(word in txt for word in ["love", "romantic", "romance", "date", "crush", "heart"]):
-        emotions = [{"name": "Love", "score": 0.9}]
-    elif any(word in txt for word in ["nostalgic", "nostalgia", "memories", "remember", "miss", "missing"]):
-        emotions = [{"name": "Nostalgia", "score": 0.9}]
+    # Heuristic: look for common mood words in text (precompiled regex)
+    mood_label = _match_mood_label(txt)
+    if mood_label:
+        emotions = [{"name": mood_label, "score": 0.9}]
     else:
         # ✅ Professional behavior: don't guess a mood when unclear
         emotions = [{"name": "Unknown", "score": 0.0}]
@@ -215,22 +297,46 @@ async def recommend_from_text(request: TextRequest):
 
     # If unknown, return empty recs (avoid accidental calm defaults)
     if top_emotion == "Unknown":
-        return RecommendationResponse(
-            emotions=emotions,
-            top_emotion=top_emotion,
-            top_score=top_score,
-            recommendations=[]
-        )
+        return {
+            "emotions": emotions,
+            "top_emotion": top_emotion,
+            "top_score": top_score,
+            "recommendations": [],
+        }
+
+    recommendations = await _get_recommendations_shared(top_emotion, emotions)
+
+    return {
+        "emotions": emotions,
+        "top_emotion": top_emotion,
+        "top_score": top_score,
+        "recommendations": recommendations,
+    }
+
+
+@app.post("/api/recommend/text", responses={200: {"model": RecommendationResponse}})
+async def recommend_from_text(request: TextRequest):
+    """
+    Analyze text to detect emotions, then get personalized song recommendations.
+
+    Flow:
+    1. User submits text
+    2. Text is analyzed for emotions (heuristic for now)
+    3. Emotions are passed to the recommender system
+    4. Returns detected emotions and recommended songs
+    """
+    return await _handle_text_request(request)
+
+
+@app.post("/api/recommend/batch", responses={200: {"model": List[RecommendationResponse]}})
+async def recommend_batch(request: BatchTextRequest):
+    """
+    Handle several text/mood queries in one round trip, amortizing HTTP
+    overhead when the UI needs multiple playlists at once.
+    """
+    return list(await asyncio.gather(*(_handle_text_request(item) for item in request.items)))
 
-    recommendations = get_recommendations(top_emotion, emotions)
 
-    return RecommendationResponse(
-        emotions=emotions,
-        top_emotion=top_emotion,
-        top_score=top_score,
-        recommendations=recommendations
-    )
-    
 @app.post("/api/recommend/similar", response_model=SimilarSongsResponse)
 async def recommend_similar_songs(request: SimilarSongsRequest):
     """
@@ -247,7 +353,8 @@ async def recommend_similar_songs(request: SimilarSongsRequest):
     - use_genre_boost: Boost same-genre tracks (default: True)
     - use_artist_diversity: Limit songs per artist (default: True)
     """
-    recommendations = get_similar_songs_by_name(
+    recommendations = await run_in_threadpool(
+        get_similar_songs_by_name,
         request.song_name,
         request.top_n,
         preset=request.preset,
@@ -278,7 +385,7 @@ async def recommend_from_spotify_track(request: SpotifyTrackRequest):
     - use_artist_diversity: Limit songs per artist (default: True)
     """
     # First, look up the song info
-    song_info = get_song_by_track_id(request.track_id)
+    song_info = await run_in_threadpool(get_song_by_track_id, request.track_id)
     
     if not song_info:
         return SpotifyTrackResponse(
@@ -290,7 +397,8 @@ async def recommend_from_spotify_track(request: SpotifyTrackRequest):
         )
     
     # Get similar songs with new parameters
-    recommendations = get_similar_songs_by_track_id(
+    recommendations = await run_in_threadpool(
+        get_similar_songs_by_track_id,
         request.track_id,
         request.top_n,
         preset=request.preset,
@@ -308,4 +416,14 @@ async def recommend_from_spotify_track(request: SpotifyTrackRequest):
 
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # uvloop + httptools (bundled with uvicorn[standard]) roughly double
+    # throughput on the I/O-bound Hume-polling routes vs asyncio + h11.
+    # Workers stay at 1 because reload and multi-worker are mutually exclusive.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        loop="uvloop",
+        http="httptools",
+    )
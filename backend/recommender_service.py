@@ -1,9 +1,20 @@
-from typing import List, Dict, Optional
+import functools
 import logging
+import sys
+import types
+from typing import List, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+try:  # Optional: fast non-cryptographic hash for large dedup batches
+    import xxhash
+except ImportError:
+    xxhash = None
 
 # Import the real recommender from src/
 from src.recommender.recommendation_pipeline import recommend_by_mood, recommend_similar_by_name, recommend_similar_song
-from src.recommender.similarity_engine import _get_songs_df
+from src.recommender.similarity_engine import _get_songs_df, _get_track_id_index
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +22,7 @@ logger = logging.getLogger(__name__)
 # Mapping from Hume AI emotion names to mood strings used by the
 # src/recommender system (happy, sad, energetic, calm, angry, romantic, mellow)
 # --------------------------------------------------------------------
-EMOTION_TO_MOOD: Dict[str, str] = {
+_EMOTION_TO_MOOD_RAW: Dict[str, str] = {
     # Direct mappings
     "joy": "happy",
     "happiness": "happy",
@@ -50,33 +61,109 @@ EMOTION_TO_MOOD: Dict[str, str] = {
     "nervousness": "calm",
 }
 
+# Interned keys let dict lookups short-circuit on pointer equality, and the
+# mapping proxy guards the table against accidental mutation at runtime.
+EMOTION_TO_MOOD: Dict[str, str] = types.MappingProxyType(
+    {sys.intern(k): sys.intern(v) for k, v in _EMOTION_TO_MOOD_RAW.items()}
+)
+
 # Default mood previously was "calm". We now avoid defaulting to a mood for unknown emotion.
-UNKNOWN_MOOD = "unknown"
+UNKNOWN_MOOD = sys.intern("unknown")
 
 
 def _map_emotion_to_mood(emotion: str) -> str:
     """
     Map a Hume AI emotion name to a mood string understood by the recommender.
     Returns UNKNOWN_MOOD if no mapping is found.
+
+    Emotions that are already canonical (lowercase, no padding) hit the map
+    directly without paying for the lower()/strip() allocations.
+    """
+    if not emotion:
+        return UNKNOWN_MOOD
+    mood = EMOTION_TO_MOOD.get(emotion)
+    if mood is not None:
+        return mood
+    return EMOTION_TO_MOOD.get(emotion.lower().strip(), UNKNOWN_MOOD)
+
+
+# Columns the UI/API actually consume. Everything else (raw audio features,
+# tempo, album metadata, ...) would just bloat to_dict() and the JSON payload.
+_OUTPUT_COLS = [
+    "track_id",
+    "track_name",
+    "track_artist",
+    "playlist_genre",
+    "playlist_subgenre",
+    "valence",
+    "energy",
+    "similarity",
+    "explanation",
+]
+
+
+def _df_to_clean_records(df: pd.DataFrame) -> List[Dict]:
     """
-    key = (emotion or "").lower().strip()
-    return EMOTION_TO_MOOD.get(key, UNKNOWN_MOOD)
+    Convert a DataFrame to JSON-safe records, replacing NaN/Inf with None.
+    Projects to the output column whitelist first so the scrub and dict
+    conversion only touch columns the client uses, then runs vectorized in
+    pandas/NumPy instead of a Python loop over every record and key.
+    """
+    keep = [c for c in _OUTPUT_COLS if c in df.columns]
+    if keep:
+        df = df[keep]
+    df = df.replace([np.inf, -np.inf], np.nan)
+    return df.astype(object).where(df.notna(), None).to_dict(orient="records")
+
+
+# Below this size, tuple keys beat the string-concat + xxhash round trip
+_XXHASH_DEDUP_THRESHOLD = 1000
 
 
 def _dedup_records(records: List[Dict]) -> List[Dict]:
     """
     Remove duplicate recommendations (same track_name + track_artist).
-    Keeps first occurrence.
+    Keeps first occurrence — dict insertion order does the bookkeeping,
+    so each record costs one hash instead of a set lookup plus insert.
+    For large batches (merged pools, playlists) the composite key is hashed
+    with xxhash when available, which is much faster than SipHash on tuples
+    of strings; the usual 10-song case keeps the simple tuple path.
+    """
+    out: Dict = {}
+    if xxhash is not None and len(records) > _XXHASH_DEDUP_THRESHOLD:
+        digest = xxhash.xxh3_64_intdigest
+        for rec in records:
+            key = digest(f"{rec.get('track_name')}\0{rec.get('track_artist')}")
+            out.setdefault(key, rec)
+    else:
+        for rec in records:
+            out.setdefault((rec.get("track_name"), rec.get("track_artist")), rec)
+    return list(out.values())
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_mood_records(mood: str, limit: int) -> tuple:
     """
-    seen = set()
-    out: List[Dict] = []
-    for rec in records:
-        key = (rec.get("track_name"), rec.get("track_artist"))
-        if key in seen:
-            continue
-        seen.add(key)
-        out.append(rec)
-    return out
+    Memoized mood → records pipeline. There are only a handful of moods and
+    limits, so most requests skip the pandas pipeline entirely. Results are
+    stored as immutable tuples of (key, value) items so cache entries can't
+    be mutated by callers.
+    """
+    df = recommend_by_mood(mood, n=limit)
+    records = _dedup_records(_df_to_clean_records(df))[:limit]
+    return tuple(tuple(rec.items()) for rec in records)
+
+
+def clear_recommendation_cache() -> None:
+    """Drop memoized mood results (call after reloading the songs dataset)."""
+    _cached_mood_records.cache_clear()
+    _EMOTION_RESULT_CACHE.clear()
+
+
+# Exact-match tier in front of the (mood, limit) LRU: Hume streams the same
+# handful of emotion names, so most requests resolve with one dict lookup
+# before any mood mapping happens.
+_EMOTION_RESULT_CACHE: Dict[tuple, tuple] = {}
 
 
 def get_recommendations(top_emotion: str, all_emotions: List[Dict] = None, limit: int = 10) -> List[Dict]:
@@ -84,6 +171,11 @@ def get_recommendations(top_emotion: str, all_emotions: List[Dict] = None, limit
     Get song recommendations based on detected emotions using the real
     src/recommender system.
     """
+    cache_key = ((top_emotion or "").lower().strip(), limit)
+    hit = _EMOTION_RESULT_CACHE.get(cache_key)
+    if hit is not None:
+        return [dict(items) for items in hit]
+
     mood = _map_emotion_to_mood(top_emotion)
     logger.info(f"Mapped emotion '{top_emotion}' -> mood '{mood}'")
 
@@ -94,18 +186,12 @@ def get_recommendations(top_emotion: str, all_emotions: List[Dict] = None, limit
         return []
 
     try:
-        df = recommend_by_mood(mood, n=limit)
-        records = df.to_dict(orient="records")
-
-        # Clean up any NaN/inf values that can't be serialized
-        for rec in records:
-            for k, v in list(rec.items()):
-                if isinstance(v, float) and (v != v or v == float("inf") or v == float("-inf")):
-                    rec[k] = None
-
-        # ✅ NEW: Deduplicate + enforce limit after dedup
-        records = _dedup_records(records)
-        return records[:limit]
+        records = _cached_mood_records(mood, limit)
+        if len(_EMOTION_RESULT_CACHE) > 256:
+            _EMOTION_RESULT_CACHE.clear()
+        _EMOTION_RESULT_CACHE[cache_key] = records
+        # Rehydrate fresh dicts so callers can't mutate the cached entries
+        return [dict(items) for items in records]
 
     except Exception as e:
         logger.error(f"Recommender failed: {e}", exc_info=True)
@@ -143,13 +229,7 @@ def get_similar_songs_by_name(
             logger.warning(f"No songs found matching: {song_name}")
             return []
 
-        records = df.to_dict(orient="records")
-
-        # Clean up any NaN/inf values
-        for rec in records:
-            for k, v in list(rec.items()):
-                if isinstance(v, float) and (v != v or v == float("inf") or v == float("-inf")):
-                    rec[k] = None
+        records = _df_to_clean_records(df)
 
         # ✅ NEW: Deduplicate + enforce limit after dedup
         records = _dedup_records(records)
@@ -165,21 +245,13 @@ def get_song_by_track_id(track_id: str) -> Optional[Dict]:
     Look up a song by its Spotify track ID.
     """
     try:
-        songs = _get_songs_df()
-        matches = songs[songs["track_id"] == track_id]
+        idx = _get_track_id_index().get(track_id)
 
-        if matches.empty:
+        if idx is None:
             logger.warning(f"No song found with track_id: {track_id}")
             return None
 
-        song = matches.iloc[0].to_dict()
-
-        # Clean up NaN values
-        for k, v in list(song.items()):
-            if isinstance(v, float) and (v != v or v == float("inf") or v == float("-inf")):
-                song[k] = None
-
-        return song
+        return _df_to_clean_records(_get_songs_df().iloc[[idx]])[0]
 
     except Exception as e:
         logger.error(f"Track ID lookup failed: {e}", exc_info=True)
@@ -210,13 +282,7 @@ def get_similar_songs_by_track_id(
             logger.warning(f"No similar songs found for track_id: {track_id}")
             return []
 
-        records = df.to_dict(orient="records")
-
-        # Clean up any NaN/inf values
-        for rec in records:
-            for k, v in list(rec.items()):
-                if isinstance(v, float) and (v != v or v == float("inf") or v == float("-inf")):
-                    rec[k] = None
+        records = _df_to_clean_records(df)
 
         # ✅ NEW: Deduplicate + enforce limit after dedup
         records = _dedup_records(records)
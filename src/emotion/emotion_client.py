@@ -7,6 +7,10 @@ import requests
 # FastAPI backend from backend/main.py
 BACKEND_BASE_URL = "http://localhost:8000"
 
+# One shared session so every call reuses a keep-alive connection to the
+# backend instead of opening a fresh socket per request.
+_session = requests.Session()
+
 
 def recommend_from_text_backend(text: str | None = None, mood: str | None = None) -> Dict[str, Any]:
     """
@@ -23,7 +27,7 @@ def recommend_from_text_backend(text: str | None = None, mood: str | None = None
     if mood:
         payload["mood"] = mood
 
-    resp = requests.post(url, json=payload, timeout=30)
+    resp = _session.post(url, json=payload, timeout=30)
     resp.raise_for_status()
     return resp.json()
 
@@ -45,6 +49,6 @@ def recommend_from_audio_backend(file_obj) -> Dict[str, Any]:
         "file": (filename, file_bytes, content_type)
     }
 
-    resp = requests.post(url, files=files, timeout=120)
+    resp = _session.post(url, files=files, timeout=120)
     resp.raise_for_status()
     return resp.json()
\ No newline at end of file
@@ -5,7 +5,6 @@ from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
 
 # Path to your dataset
 DATA_PATH = Path("data/songs.csv")
@@ -29,6 +28,10 @@ REQUIRED_META = ["track_id", "track_name", "track_artist"]
 # Optional metadata for genre filtering
 GENRE_COLS = ["playlist_genre", "playlist_subgenre"]
 
+# Optional extras kept at load: release date feeds the nostalgic-mood year
+# boost, popularity feeds the offline evaluation metrics
+EXTRA_COLS = ["track_album_release_date", "track_popularity"]
+
 # --------------------------------------------------------------------
 # Feature Weight Presets
 # --------------------------------------------------------------------
@@ -96,15 +99,34 @@ FEATURE_WEIGHT_PRESETS: Dict[str, Dict[str, float]] = {
     },
 }
 
-# Global scaler (fitted once on load)
-_SCALER: Optional[StandardScaler] = None
+# Per-feature standardization stats (mean, std), fitted once on load.
+# Replaces sklearn's StandardScaler: the math is two column reductions and
+# an affine transform, identical numerically (population std, ddof=0) but
+# without the estimator/validation overhead.
+_FEATURE_STATS: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
+
+def transform_features(X: np.ndarray) -> np.ndarray:
+    """Standardize X with the fitted per-feature (mean, std)."""
+    if _FEATURE_STATS is None:
+        raise RuntimeError("Feature stats not fitted yet; call build_feature_matrix first.")
+    mu, sd = _FEATURE_STATS
+    return (X - mu) / sd
 
 
 def load_song_data(path: Path = DATA_PATH) -> pd.DataFrame:
     """
     Load the Spotify songs dataset and validate required columns.
     """
-    df = pd.read_csv(path)
+    # Only parse the columns the pipeline uses, with explicit dtypes: audio
+    # features land directly as float32 (no inference pass, no downstream
+    # astype) and string columns skip per-chunk type sniffing.
+    wanted = set(REQUIRED_META) | set(AUDIO_FEATURES) | set(GENRE_COLS) | set(EXTRA_COLS)
+    df = pd.read_csv(
+        path,
+        usecols=lambda c: c in wanted,
+        dtype={f: np.float32 for f in AUDIO_FEATURES},
+    )
 
     missing = [c for c in REQUIRED_META + AUDIO_FEATURES if c not in df.columns]
     if missing:
@@ -129,20 +151,24 @@ def build_feature_matrix(
     Returns:
         Tuple of (feature_matrix, feature_column_names)
     """
-    global _SCALER
-    
-    X = df[AUDIO_FEATURES].astype(float).values
-    
+    global _FEATURE_STATS
+
+    # float32 halves memory traffic for the similarity matvec (which is
+    # bandwidth-bound), and C-contiguous layout lets BLAS dispatch SGEMV
+    X = np.ascontiguousarray(df[AUDIO_FEATURES].to_numpy(dtype=np.float32))
+
     # Handle NaN/inf values before scaling
     X = np.nan_to_num(X, nan=0.0, posinf=1.0, neginf=0.0)
-    
-    # Apply StandardScaler to normalize features (so tempo/loudness don't dominate)
-    if _SCALER is None:
-        _SCALER = StandardScaler()
-        X_scaled = _SCALER.fit_transform(X)
-    else:
-        X_scaled = _SCALER.transform(X)
-    
+
+    # Standardize features (so tempo/loudness don't dominate), fitting the
+    # per-feature stats on the first call
+    if _FEATURE_STATS is None:
+        mu = X.mean(axis=0, dtype=np.float32)
+        sd = X.std(axis=0, dtype=np.float32)
+        sd[sd == 0] = 1.0
+        _FEATURE_STATS = (mu, sd)
+    X_scaled = transform_features(X)
+
     # Handle any NaN/inf that might arise from scaling
     X_scaled = np.nan_to_num(X_scaled, nan=0.0, posinf=0.0, neginf=0.0)
     
@@ -151,7 +177,7 @@ def build_feature_matrix(
         weights = FEATURE_WEIGHT_PRESETS[preset]
     
     if weights:
-        weight_array = np.array([weights.get(f, 1.0) for f in AUDIO_FEATURES])
+        weight_array = np.array([weights.get(f, 1.0) for f in AUDIO_FEATURES], dtype=np.float32)
         X_scaled = X_scaled * weight_array
     
     return X_scaled, AUDIO_FEATURES
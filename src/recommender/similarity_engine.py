@@ -1,17 +1,28 @@
 from __future__ import annotations
 
+import functools
+import threading
+from pathlib import Path
 from typing import Dict, Optional
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics.pairwise import cosine_similarity
 
+import src.recommender.feature_builder as feature_builder
 from src.recommender.feature_builder import (
+    DATA_PATH,
     load_song_data,
     build_feature_matrix,
     FEATURE_WEIGHT_PRESETS,
 )
 
+# On-disk cache for the normalized default matrix and scaler stats, keyed by
+# the CSV's mtime. The dataset is static, so cold starts can mmap the matrix
+# instead of re-parsing, re-scaling and re-normalizing it.
+_CACHE_DIR = Path("data/cache")
+_MATRIX_CACHE = _CACHE_DIR / "features_norm.npy"
+_STATS_CACHE = _CACHE_DIR / "feature_stats.npz"
+
 
 # --------------------------------------------------------------------
 # Global in-memory cache for songs and feature matrix
@@ -20,16 +31,140 @@ _SONGS_DF: pd.DataFrame | None = None
 _FEATURE_MATRIX: np.ndarray | None = None
 _FEATURE_COLS: list[str] | None = None
 _CURRENT_PRESET: str | None = None  # Track which preset is cached
+_TRACK_ID_INDEX: Dict[str, int] | None = None  # track_id → row position
+_FEATURE_MATRIX_NORM: np.ndarray | None = None  # L2-normalized rows (default preset)
+_PRESET_MATRICES: Dict[str, np.ndarray] = {}  # preset name → L2-normalized matrix
+_TRACK_NAME_LOWER: pd.Series | None = None  # lowercased/stripped track_name column
+_NAME_TO_IDX: Dict[str, int] | None = None  # lowered track_name → row position
+_META_DF: pd.DataFrame | None = None  # narrow metadata slice for result frames
+_GENRE_CODES: np.ndarray | None = None  # int codes of lowercased playlist_genre
+_SUBGENRE_CODES: np.ndarray | None = None  # int codes of lowercased playlist_subgenre
+_RELEASE_YEARS: np.ndarray | None = None  # float years (NaN where unparseable)
+
+# Columns a similar-songs result actually carries; everything else
+# (tempo, album metadata, ...) was sliced per query only to be dropped
+# by the API/UI downstream.
+_RESULT_META_COLS = [
+    "track_id",
+    "track_name",
+    "track_artist",
+    "playlist_genre",
+    "playlist_subgenre",
+    "valence",
+    "energy",
+]
 
 
 def _get_songs_df() -> pd.DataFrame:
-    """Load songs.csv once and cache it."""
+    """
+    Load songs.csv once and cache it. Duplicate track_ids (the CSV has a
+    track per playlist appearance) are dropped here so the feature matrix
+    has one row per track and queries don't need a per-call dedup pass.
+    """
     global _SONGS_DF
     if _SONGS_DF is None:
-        _SONGS_DF = load_song_data()
+        _SONGS_DF = (
+            load_song_data()
+            .drop_duplicates(subset=["track_id"], keep="first")
+            .reset_index(drop=True)
+        )
     return _SONGS_DF
 
 
+def _get_track_id_index() -> Dict[str, int]:
+    """
+    Build (once) and return a track_id → row-position dict, so lookups are
+    O(1) instead of an O(N) boolean scan over the track_id column.
+    For duplicated track_ids the first occurrence wins, matching the
+    `matches[0]` behavior of the previous scan.
+    """
+    global _TRACK_ID_INDEX
+    if _TRACK_ID_INDEX is None:
+        songs = _get_songs_df()
+        index: Dict[str, int] = {}
+        for i, tid in enumerate(songs["track_id"].to_numpy()):
+            index.setdefault(tid, i)
+        _TRACK_ID_INDEX = index
+    return _TRACK_ID_INDEX
+
+
+def _get_meta_df() -> pd.DataFrame:
+    """
+    Narrow view of the songs frame holding only _RESULT_META_COLS, built
+    once. Per-query result construction slices this instead of the full
+    ~20-column frame, so each query touches a fraction of the column data.
+    """
+    global _META_DF
+    if _META_DF is None:
+        songs = _get_songs_df()
+        _META_DF = songs[[c for c in _RESULT_META_COLS if c in songs.columns]]
+    return _META_DF
+
+
+def _get_genre_codes() -> tuple[np.ndarray | None, np.ndarray | None]:
+    """
+    Integer-encode the (lowercased) genre and subgenre columns once.
+    The boost check then becomes a SIMD int16 equality over the candidate
+    rows instead of per-query string lowering and comparison. Missing
+    values encode as -1, which can never equal a valid reference code.
+    """
+    global _GENRE_CODES, _SUBGENRE_CODES
+    if _GENRE_CODES is None:
+        songs = _get_songs_df()
+        if "playlist_genre" in songs.columns:
+            _GENRE_CODES = pd.Categorical(songs["playlist_genre"].str.lower()).codes.astype(np.int16)
+        else:
+            _GENRE_CODES = np.array([])  # sentinel: column absent
+        if "playlist_subgenre" in songs.columns:
+            _SUBGENRE_CODES = pd.Categorical(songs["playlist_subgenre"].str.lower()).codes.astype(np.int16)
+    genre = _GENRE_CODES if _GENRE_CODES.size else None
+    return genre, _SUBGENRE_CODES
+
+
+def _get_release_years() -> np.ndarray | None:
+    """
+    Parse track_album_release_date into a float year array once (NaN where
+    the date is missing or unparseable). The nostalgic boost previously
+    re-ran pd.to_datetime over the whole column on every query.
+    """
+    global _RELEASE_YEARS
+    if _RELEASE_YEARS is None:
+        songs = _get_songs_df()
+        if "track_album_release_date" not in songs.columns:
+            return None
+        _RELEASE_YEARS = (
+            pd.to_datetime(songs["track_album_release_date"], errors="coerce")
+            .dt.year.to_numpy(dtype=np.float64)
+        )
+    return _RELEASE_YEARS
+
+
+def _get_track_name_lower() -> pd.Series:
+    """
+    Lowercased, stripped track_name column, computed once. Name searches
+    previously re-ran .str.lower().str.strip() over all N names per query.
+    """
+    global _TRACK_NAME_LOWER
+    if _TRACK_NAME_LOWER is None:
+        _TRACK_NAME_LOWER = _get_songs_df()["track_name"].str.lower().str.strip()
+    return _TRACK_NAME_LOWER
+
+
+def _get_name_index() -> Dict[str, int]:
+    """
+    Lowered track_name → first row position, built once. Exact-match name
+    searches (the common case) become one dict lookup; only partial matches
+    still pay a linear contains pass.
+    """
+    global _NAME_TO_IDX
+    if _NAME_TO_IDX is None:
+        index: Dict[str, int] = {}
+        for i, name in enumerate(_get_track_name_lower().to_numpy()):
+            index.setdefault(name, i)
+        _NAME_TO_IDX = index
+    return _NAME_TO_IDX
+
+
 def _get_feature_matrix(
     preset: Optional[str] = None,
     weights: Optional[Dict[str, float]] = None,
@@ -64,6 +199,88 @@ def _get_feature_matrix(
     return _FEATURE_MATRIX, _FEATURE_COLS
 
 
+def _normalize_rows(X: np.ndarray) -> np.ndarray:
+    """
+    Return X with L2-normalized rows as C-contiguous float32.
+    With unit rows, cosine similarity against row i reduces to the single
+    matvec `X_norm @ X_norm[i]`, so no per-query renormalization is needed
+    and NumPy dispatches straight to BLAS SGEMV.
+    """
+    X = np.ascontiguousarray(X, dtype=np.float32)
+    norms = np.linalg.norm(X, axis=1, keepdims=True)
+    return X / np.where(norms == 0, 1, norms)
+
+
+# Per-thread scratch buffer for the query sims vector: at sustained QPS a
+# fresh length-N float32 allocation per request is pure allocator churn,
+# since the values are consumed within the query.
+_SIMS_BUF = threading.local()
+
+
+def _query_sims(Xn: np.ndarray, idx: int) -> np.ndarray:
+    """Compute Xn @ Xn[idx] into a reusable thread-local buffer."""
+    buf = getattr(_SIMS_BUF, "buf", None)
+    if buf is None or buf.shape[0] != Xn.shape[0]:
+        buf = np.empty(Xn.shape[0], dtype=np.float32)
+        _SIMS_BUF.buf = buf
+    np.dot(Xn, Xn[idx], out=buf)
+    return buf
+
+
+def _get_normalized_matrix(preset: Optional[str] = None) -> np.ndarray:
+    """
+    Get the L2-normalized feature matrix for a preset. The default (no
+    preset) matrix is normalized once and cached alongside _FEATURE_MATRIX;
+    preset matrices are built on first use and kept in _PRESET_MATRICES, so
+    switching preset tabs in the UI doesn't rebuild+rescale the whole matrix
+    per query. There are only a handful of presets, each ~N×9 float32.
+    """
+    global _FEATURE_MATRIX_NORM
+
+    if preset:
+        Xn = _PRESET_MATRICES.get(preset)
+        if Xn is None:
+            X, _ = _get_feature_matrix(preset=preset)
+            Xn = _normalize_rows(X)
+            _PRESET_MATRICES[preset] = Xn
+        return Xn
+
+    if _FEATURE_MATRIX_NORM is None:
+        _FEATURE_MATRIX_NORM = _load_cached_matrix()
+    if _FEATURE_MATRIX_NORM is None:
+        X, _ = _get_feature_matrix()
+        _FEATURE_MATRIX_NORM = _normalize_rows(X)
+        _save_cached_matrix(_FEATURE_MATRIX_NORM)
+    return _FEATURE_MATRIX_NORM
+
+
+def _load_cached_matrix() -> np.ndarray | None:
+    """
+    Memory-map the persisted normalized matrix if it matches the current
+    CSV (by mtime), restoring the scaler stats alongside it so the mood
+    prototype transform works without rebuilding the matrix.
+    """
+    try:
+        stats = np.load(_STATS_CACHE)
+        if float(stats["csv_mtime"]) != DATA_PATH.stat().st_mtime:
+            return None
+        feature_builder._FEATURE_STATS = (stats["mu"], stats["sd"])
+        return np.load(_MATRIX_CACHE, mmap_mode="r")
+    except Exception:
+        return None
+
+
+def _save_cached_matrix(Xn: np.ndarray) -> None:
+    """Persist the normalized matrix and scaler stats; best-effort."""
+    try:
+        mu, sd = feature_builder._FEATURE_STATS
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        np.save(_MATRIX_CACHE, Xn)
+        np.savez(_STATS_CACHE, mu=mu, sd=sd, csv_mtime=DATA_PATH.stat().st_mtime)
+    except Exception:
+        pass  # cache dir not writable — cold rebuild still works
+
+
 # --------------------------------------------------------------------
 # Genre boosting helper
 # --------------------------------------------------------------------
@@ -71,29 +288,27 @@ GENRE_BOOST_FACTOR = 1.15  # Boost same-genre tracks by 15%
 SUBGENRE_BOOST_FACTOR = 1.10  # Additional boost for same subgenre
 
 
-def _apply_genre_boost(
-    result: pd.DataFrame,
-    ref_genre: Optional[str],
-    ref_subgenre: Optional[str],
-) -> pd.DataFrame:
+def _apply_genre_boost(sims: np.ndarray, ref_idx: int) -> None:
     """
-    Boost similarity scores for tracks in the same genre/subgenre.
+    Boost similarity scores in place for tracks sharing the reference row's
+    genre/subgenre, using the cached integer genre codes. Running on the
+    full sims array before top-k selection means the partition already sees
+    the final ranking — no post-boost re-sort needed.
     """
-    if ref_genre is None or "playlist_genre" not in result.columns:
-        return result
-    
-    result = result.copy()
-    
+    genre_codes, subgenre_codes = _get_genre_codes()
+    if genre_codes is None:
+        return
+
     # Boost same genre
-    same_genre_mask = result["playlist_genre"].str.lower() == ref_genre.lower()
-    result.loc[same_genre_mask, "similarity"] *= GENRE_BOOST_FACTOR
-    
+    ref_genre_code = genre_codes[ref_idx]
+    if ref_genre_code >= 0:
+        sims[genre_codes == ref_genre_code] *= GENRE_BOOST_FACTOR
+
     # Additional boost for same subgenre
-    if ref_subgenre and "playlist_subgenre" in result.columns:
-        same_subgenre_mask = result["playlist_subgenre"].str.lower() == ref_subgenre.lower()
-        result.loc[same_subgenre_mask, "similarity"] *= SUBGENRE_BOOST_FACTOR
-    
-    return result
+    if subgenre_codes is not None:
+        ref_subgenre_code = subgenre_codes[ref_idx]
+        if ref_subgenre_code >= 0:
+            sims[subgenre_codes == ref_subgenre_code] *= SUBGENRE_BOOST_FACTOR
 
 
 # --------------------------------------------------------------------
@@ -105,24 +320,16 @@ MAX_PER_ARTIST = 2  # Max songs from same artist in recommendations
 def _apply_artist_diversity(result: pd.DataFrame, top_k: int) -> pd.DataFrame:
     """
     Limit the number of songs per artist to avoid repetitive recommendations.
+    Done with a C-level cumulative group count instead of an iterrows loop
+    (which builds a Series per row). Callers hand in candidates already
+    sorted by (boosted) similarity, so a track is kept iff it is among the
+    first MAX_PER_ARTIST rows of its artist — no re-sort needed here.
     """
     if "track_artist" not in result.columns:
         return result.head(top_k)
-    
-    result = result.sort_values("similarity", ascending=False)
-    
-    selected = []
-    artist_counts: Dict[str, int] = {}
-    
-    for _, row in result.iterrows():
-        artist = row.get("track_artist", "Unknown")
-        if artist_counts.get(artist, 0) < MAX_PER_ARTIST:
-            selected.append(row)
-            artist_counts[artist] = artist_counts.get(artist, 0) + 1
-            if len(selected) >= top_k:
-                break
-    
-    return pd.DataFrame(selected)
+
+    keep = result.groupby("track_artist", sort=False).cumcount() < MAX_PER_ARTIST
+    return result[keep].head(top_k)
 
 
 # --------------------------------------------------------------------
@@ -248,6 +455,46 @@ MOOD_TARGETS: Dict[str, Dict[str, float]] = {
 }
 
 
+def _prototype_raw_vector(proto: Dict[str, float]) -> np.ndarray:
+    """Denormalize a 0-1 prototype to raw feature space (tempo→BPM, loudness→dB)."""
+    raw = []
+    for f in AUDIO_FEATURES:
+        v = proto.get(f, 0.5)
+        if f == "tempo":
+            raw.append(v * 150 + 50)
+        elif f == "loudness":
+            raw.append(v * 60 - 60)
+        else:
+            raw.append(v)
+    return np.array(raw, dtype=np.float32)
+
+
+# Prototype lookup table: one (num_moods, 9) float32 array built at import,
+# so each mood query indexes a row instead of rebuilding the denormalized
+# Python list per call.
+_MOOD_NAMES = list(MOOD_PROTOTYPES)
+_MOOD_IDX: Dict[str, int] = {name: i for i, name in enumerate(_MOOD_NAMES)}
+_MOOD_PROTO_RAW = np.stack([_prototype_raw_vector(p) for p in MOOD_PROTOTYPES.values()])
+
+# Song × mood cosine similarity table, filled on first mood query. The mood
+# set is static, so every query after the first is a column lookup plus
+# top-k selection — no scaling, normalization or matvec left on the path.
+_MOOD_SIMS: np.ndarray | None = None
+
+
+def _get_mood_sims() -> np.ndarray:
+    """(N, num_moods) cosine similarities of every song to every prototype."""
+    global _MOOD_SIMS
+    if _MOOD_SIMS is None:
+        Xn = _get_normalized_matrix()  # fits the scaler on first call
+        protos = _MOOD_PROTO_RAW
+        if feature_builder._FEATURE_STATS is not None:
+            protos = feature_builder.transform_features(protos)
+        Q = _normalize_rows(np.asarray(protos, dtype=np.float32))
+        _MOOD_SIMS = np.asarray(Xn @ Q.T)
+    return _MOOD_SIMS
+
+
 def _normalize_tempo(tempo: float) -> float:
     """Normalize tempo from BPM (typically 50-200) to 0-1 scale."""
     return np.clip((tempo - 50) / 150, 0, 1)
@@ -276,88 +523,58 @@ def get_mood_recommendations(mood: str, top_k: int = 10) -> pd.DataFrame:
     - and more...
     """
     songs = _get_songs_df()
-    X, feature_cols = _get_feature_matrix()  # Uses StandardScaler
-    
-    # Get the mood prototype and scale it the same way
+
     mood_key = mood.lower()
     if mood_key not in MOOD_PROTOTYPES:
         mood_key = "calm"  # Safe fallback
-    
-    proto = MOOD_PROTOTYPES[mood_key]
-    
-    # Build prototype vector in raw feature space, then we'll compare
-    # We need to handle tempo specially (it's in BPM, not 0-1)
-    proto_raw = []
-    for f in AUDIO_FEATURES:
-        if f == "tempo":
-            # Convert our 0-1 tempo target back to BPM for comparison
-            proto_raw.append(proto.get(f, 0.5) * 150 + 50)
-        elif f == "loudness":
-            # Convert our 0-1 loudness target back to dB (roughly -60 to 0)
-            proto_raw.append(proto.get(f, 0.5) * 60 - 60)
-        else:
-            proto_raw.append(proto.get(f, 0.5))
-    
-    proto_vector = np.array(proto_raw).reshape(1, -1)
-    
-    # Scale the prototype using the same scaler as the songs
-    from src.recommender.feature_builder import _SCALER
-    if _SCALER is not None:
-        proto_scaled = _SCALER.transform(proto_vector)
-    else:
-        proto_scaled = proto_vector
-    
-    # Compute cosine similarity between prototype and all songs
-    sims = cosine_similarity(proto_scaled, X)[0]
-    
-    # Add similarity scores to dataframe
-    result = songs.copy()
-    result["similarity"] = sims
-    
+
+    # Column lookup in the precomputed song × mood similarity table
+    sims = _get_mood_sims()[:, _MOOD_IDX[mood_key]]
+
     # Apply year-based boost ONLY for nostalgic mood (prefer older songs)
     # For other moods, year doesn't improve recommendations
-    if mood_key == "nostalgic" and "track_album_release_date" in result.columns:
-        try:
-            # Extract year from release date
-            result["_year"] = pd.to_datetime(
-                result["track_album_release_date"], errors="coerce"
-            ).dt.year
-            
-            # Boost songs from before 2010 by up to 10%
-            # Older = more nostalgic feel
-            year_boost = result["_year"].apply(
-                lambda y: 1.08 if pd.notna(y) and y < 2000 else 
-                         (1.05 if pd.notna(y) and y < 2010 else 1.0)
+    if mood_key == "nostalgic":
+        years = _get_release_years()
+        if years is not None:
+            # Boost songs from before 2010 by up to 10%; older = more
+            # nostalgic feel. NaN years compare False and keep factor 1.0.
+            year_boost = np.where(
+                years < 2000, 1.08, np.where(years < 2010, 1.05, 1.0)
             )
-            result["similarity"] = result["similarity"] * year_boost
-            result = result.drop(columns=["_year"])
-        except Exception:
-            pass  # If year parsing fails, just skip the boost
-    
-    # Sort by similarity and take top_k
-    result = result.sort_values("similarity", ascending=False).head(top_k)
-    
-    # Generate explanations highlighting key matching features
-    def _explain(row: pd.Series) -> str:
-        highlights = []
-        if mood_key == "focus":
-            inst = row.get("instrumentalness", 0)
-            speech = row.get("speechiness", 0)
-            if inst > 0.3:
-                highlights.append(f"instrumental ({inst:.0%})")
-            if speech < 0.1:
+            sims = sims * year_boost
+
+    # Top-k selection on the sims array instead of a full-frame sort+copy
+    k = min(top_k, sims.size)
+    part = np.argpartition(-sims, k - 1)[:k]
+    top = part[np.argsort(-sims[part])]
+
+    result = songs.iloc[top].copy()
+    result["similarity"] = sims[top]
+
+    # Generate explanations highlighting key matching features. Formatting
+    # over plain numpy arrays avoids the per-row Series construction that
+    # DataFrame.apply(axis=1) would pay.
+    n = len(result)
+    v = result["valence"].to_numpy() if "valence" in result.columns else np.full(n, np.nan)
+    e = result["energy"].to_numpy() if "energy" in result.columns else np.full(n, np.nan)
+    if mood_key == "focus":
+        inst = result["instrumentalness"].to_numpy() if "instrumentalness" in result.columns else np.zeros(n)
+        speech = result["speechiness"].to_numpy() if "speechiness" in result.columns else np.zeros(n)
+        explanations = []
+        for vi, ei, ii, si in zip(v, e, inst, speech):
+            highlights = []
+            if ii > 0.3:
+                highlights.append(f"instrumental ({ii:.0%})")
+            if si < 0.1:
                 highlights.append("low vocals")
-        
-        v = row.get("valence", np.nan)
-        e = row.get("energy", np.nan)
-        base = f"Matches '{mood}' mood (valence={v:.2f}, energy={e:.2f})"
-        
-        if highlights:
-            return base + " — " + ", ".join(highlights)
-        return base
-    
-    result = result.copy()
-    result["explanation"] = result.apply(_explain, axis=1)
+            base = f"Matches '{mood}' mood (valence={vi:.2f}, energy={ei:.2f})"
+            explanations.append(base + " — " + ", ".join(highlights) if highlights else base)
+        result["explanation"] = explanations
+    else:
+        result["explanation"] = [
+            f"Matches '{mood}' mood (valence={vi:.2f}, energy={ei:.2f})"
+            for vi, ei in zip(v, e)
+        ]
     
     preferred_cols = [
         "track_id",
@@ -376,78 +593,76 @@ def get_mood_recommendations(mood: str, top_k: int = 10) -> pd.DataFrame:
     return result[ordered]
 
 
-def get_similar_songs(
+@functools.lru_cache(maxsize=1024)
+def _similar_songs_cached(
     track_id: str,
-    top_k: int = 10,
-    preset: Optional[str] = None,
-    use_genre_boost: bool = True,
-    use_artist_diversity: bool = True,
+    top_k: int,
+    preset: Optional[str],
+    use_genre_boost: bool,
+    use_artist_diversity: bool,
 ) -> pd.DataFrame:
     """
-    Find tracks that are similar to the given track_id in the full
-    feature space (danceability/energy/valence/tempo/… depending on
-    build_feature_matrix implementation).
-    
-    Args:
-        track_id: The Spotify track ID to find similar songs for
-        top_k: Number of recommendations to return
-        preset: Optional feature weight preset ("mood", "workout", "chill", "psychedelic")
-        use_genre_boost: If True, boost same-genre tracks
-        use_artist_diversity: If True, limit max songs per artist
+    Memoized body of get_similar_songs. The catalog is static, so results
+    for identical (track_id, top_k, preset, flags) are cached; the public
+    wrapper hands out copies so callers can't mutate cache entries.
     """
     songs = _get_songs_df()
-    X, feature_cols = _get_feature_matrix(preset=preset)
+    Xn = _get_normalized_matrix(preset=preset)
 
     if "track_id" not in songs.columns:
         raise KeyError("Songs dataframe must contain a 'track_id' column.")
 
-    matches = songs.index[songs["track_id"] == track_id]
-    if len(matches) == 0:
+    # O(1) dict lookup instead of a boolean scan over the track_id column
+    idx = _get_track_id_index().get(track_id)
+    if idx is None:
         raise KeyError(f"Unknown track_id: {track_id}")
-    idx = matches[0]
-    
+
     # Get reference track info for genre boosting
-    ref_track = songs.loc[idx]
+    ref_track = songs.iloc[idx]
     ref_genre = ref_track.get("playlist_genre") if "playlist_genre" in songs.columns else None
-    ref_subgenre = ref_track.get("playlist_subgenre") if "playlist_subgenre" in songs.columns else None
 
-    base_vec = X[idx : idx + 1]
-    sims = cosine_similarity(base_vec, X)[0]
+    sims = _query_sims(Xn, idx)
+
+    # Boost on the full sims array first, so the top-k partition below sees
+    # the final (boosted) ranking and no re-sort is needed afterwards
+    if use_genre_boost:
+        _apply_genre_boost(sims, idx)
 
-    result = songs.copy()
-    result["similarity"] = sims
+    # Select an oversampled top pool with argpartition (O(N)) and sort only
+    # that pool, instead of sorting the full frame (O(N log N)) when only
+    # top_k rows survive. The pool is oversized because artist diversity
+    # can shrink it.
+    pool = min(sims.size, max(top_k * 10, 200))
+    part = np.argpartition(-sims, pool - 1)[:pool]
+    top = part[np.argsort(-sims[part])]
+
+    result = _get_meta_df().iloc[top].copy()
+    result["similarity"] = sims[top]
 
     # Drop the reference track itself
     result = result[result["track_id"] != track_id]
     
-    # Remove duplicate tracks (same track_id), keep the one with highest similarity
-    result = result.sort_values("similarity", ascending=False)
-    result = result.drop_duplicates(subset=["track_id"], keep="first")
-    
-    # Apply genre boosting if enabled
-    if use_genre_boost:
-        result = _apply_genre_boost(result, ref_genre, ref_subgenre)
-        result = result.sort_values("similarity", ascending=False)
-    
     # Apply artist diversity if enabled
     if use_artist_diversity:
         result = _apply_artist_diversity(result, top_k)
     else:
-        result = result.head(top_k)
-
-    def _explain(row: pd.Series) -> str:
-        genre_info = ""
-        if ref_genre and "playlist_genre" in row.index:
-            row_genre = row.get("playlist_genre", "")
-            if row_genre and str(row_genre).lower() == str(ref_genre).lower():
-                genre_info = f" Both are in the {ref_genre} genre."
-        return (
-            f"Recommended because it has similar audio characteristics "
-            f"(valence, energy, tempo, etc.) to your chosen track.{genre_info}"
+        result = result.head(top_k).copy()
+
+    # Vectorized explanation: the string only varies by genre match, so one
+    # boolean mask and np.where replace the per-row apply.
+    base_explanation = (
+        "Recommended because it has similar audio characteristics "
+        "(valence, energy, tempo, etc.) to your chosen track."
+    )
+    if ref_genre and "playlist_genre" in result.columns:
+        same_genre = result["playlist_genre"].astype(str).str.lower() == str(ref_genre).lower()
+        result["explanation"] = np.where(
+            same_genre,
+            base_explanation + f" Both are in the {ref_genre} genre.",
+            base_explanation,
         )
-
-    result = result.copy()
-    result["explanation"] = result.apply(_explain, axis=1)
+    else:
+        result["explanation"] = base_explanation
 
     preferred_cols = [
         "track_id",
@@ -464,6 +679,74 @@ def get_similar_songs(
     return result[ordered]
 
 
+def get_similar_songs(
+    track_id: str,
+    top_k: int = 10,
+    preset: Optional[str] = None,
+    use_genre_boost: bool = True,
+    use_artist_diversity: bool = True,
+) -> pd.DataFrame:
+    """
+    Find tracks that are similar to the given track_id in the full
+    feature space (danceability/energy/valence/tempo/… depending on
+    build_feature_matrix implementation). Results are memoized per
+    argument combination, so repeat queries for the same track skip the
+    similarity pass entirely.
+
+    Args:
+        track_id: The Spotify track ID to find similar songs for
+        top_k: Number of recommendations to return
+        preset: Optional feature weight preset ("mood", "workout", "chill", "psychedelic")
+        use_genre_boost: If True, boost same-genre tracks
+        use_artist_diversity: If True, limit max songs per artist
+    """
+    return _similar_songs_cached(
+        track_id, top_k, preset, use_genre_boost, use_artist_diversity
+    ).copy()
+
+
+def get_similar_songs_batch(
+    track_ids: list[str],
+    top_k: int = 10,
+    preset: Optional[str] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Top-k similar songs for several seed tracks in one call.
+
+    The B query rows go through one (N, B) GEMM instead of B separate
+    matvecs, so the feature matrix is streamed through once for the whole
+    batch. Returns {track_id: result frame}. Genre boost and artist
+    diversity are not applied here; use get_similar_songs for the full
+    single-seed treatment.
+    """
+    Xn = _get_normalized_matrix(preset=preset)
+    index = _get_track_id_index()
+
+    idxs = []
+    for tid in track_ids:
+        i = index.get(tid)
+        if i is None:
+            raise KeyError(f"Unknown track_id: {tid}")
+        idxs.append(i)
+
+    sims = Xn @ Xn[np.asarray(idxs)].T  # (N, B)
+
+    meta = _get_meta_df()
+    results: Dict[str, pd.DataFrame] = {}
+    for col, tid, i in zip(sims.T, track_ids, idxs):
+        # top_k + 1 so the seed row can be dropped after selection
+        pool = min(col.size, top_k + 1)
+        part = np.argpartition(-col, pool - 1)[:pool]
+        top = part[np.argsort(-col[part])]
+        top = top[top != i][:top_k]
+
+        result = meta.iloc[top].copy()
+        result["similarity"] = col[top]
+        results[tid] = result
+
+    return results
+
+
 def get_similar_songs_by_name(
     song_name: str,
     top_k: int = 10,
@@ -483,75 +766,73 @@ def get_similar_songs_by_name(
         use_artist_diversity: If True, limit max songs per artist
     """
     songs = _get_songs_df()
-    X, feature_cols = _get_feature_matrix(preset=preset)
+    Xn = _get_normalized_matrix(preset=preset)
 
     if "track_name" not in songs.columns:
         raise KeyError("Songs dataframe must contain a 'track_name' column.")
 
-    # Case-insensitive partial match
     song_name_lower = song_name.lower().strip()
-    
-    # Try exact match first
-    mask = songs["track_name"].str.lower().str.strip() == song_name_lower
-    if mask.sum() == 0:
-        # Try partial/contains match
-        mask = songs["track_name"].str.lower().str.contains(song_name_lower, na=False, regex=False)
-    
-    if mask.sum() == 0:
-        # No match found - return empty with message
-        return pd.DataFrame({
-            "track_name": [],
-            "track_artist": [],
-            "similarity": [],
-            "explanation": [],
-        })
-    
-    # Get the first matching song
-    idx = songs.index[mask][0]
+
+    # Try exact match first — O(1) against the name index
+    idx = _get_name_index().get(song_name_lower)
+    if idx is None:
+        # Fall back to a case-insensitive partial/contains match
+        mask = _get_track_name_lower().str.contains(song_name_lower, na=False, regex=False)
+
+        if mask.sum() == 0:
+            # No match found - return empty with message
+            return pd.DataFrame({
+                "track_name": [],
+                "track_artist": [],
+                "similarity": [],
+                "explanation": [],
+            })
+
+        # Get the first matching song
+        idx = songs.index[mask][0]
     matched_song = songs.loc[idx]
     matched_name = matched_song["track_name"]
     matched_artist = matched_song.get("track_artist", "Unknown")
     matched_track_id = matched_song.get("track_id", "")
     ref_genre = matched_song.get("playlist_genre") if "playlist_genre" in songs.columns else None
-    ref_subgenre = matched_song.get("playlist_subgenre") if "playlist_subgenre" in songs.columns else None
 
-    base_vec = X[idx : idx + 1]
-    sims = cosine_similarity(base_vec, X)[0]
+    sims = _query_sims(Xn, idx)
+
+    # Boost then select, same as get_similar_songs: O(N) partition plus a
+    # small sort instead of a full-frame sort and copy.
+    if use_genre_boost:
+        _apply_genre_boost(sims, idx)
 
-    result = songs.copy()
-    result["similarity"] = sims
+    pool = min(sims.size, max(top_k * 10, 200))
+    part = np.argpartition(-sims, pool - 1)[:pool]
+    top = part[np.argsort(-sims[part])]
+
+    result = _get_meta_df().iloc[top].copy()
+    result["similarity"] = sims[top]
 
     # Remove the reference track (by track_id to catch duplicates)
     result = result[result["track_id"] != matched_track_id]
     
-    # Remove duplicate tracks (same track_id), keep the one with highest similarity
-    result = result.sort_values("similarity", ascending=False)
-    result = result.drop_duplicates(subset=["track_id"], keep="first")
-    
-    # Apply genre boosting if enabled
-    if use_genre_boost:
-        result = _apply_genre_boost(result, ref_genre, ref_subgenre)
-        result = result.sort_values("similarity", ascending=False)
-    
     # Apply artist diversity if enabled
     if use_artist_diversity:
         result = _apply_artist_diversity(result, top_k)
     else:
-        result = result.head(top_k)
-
-    def _explain(row: pd.Series) -> str:
-        genre_info = ""
-        if ref_genre and "playlist_genre" in row.index:
-            row_genre = row.get("playlist_genre", "")
-            if row_genre and str(row_genre).lower() == str(ref_genre).lower():
-                genre_info = f" Both are in the {ref_genre} genre."
-        return (
-            f"Similar to \"{matched_name}\" by {matched_artist} based on audio features "
-            f"(danceability, energy, valence, tempo, etc.).{genre_info}"
+        result = result.head(top_k).copy()
+
+    # Vectorized explanation, same np.where pattern as get_similar_songs
+    base_explanation = (
+        f"Similar to \"{matched_name}\" by {matched_artist} based on audio features "
+        f"(danceability, energy, valence, tempo, etc.)."
+    )
+    if ref_genre and "playlist_genre" in result.columns:
+        same_genre = result["playlist_genre"].astype(str).str.lower() == str(ref_genre).lower()
+        result["explanation"] = np.where(
+            same_genre,
+            base_explanation + f" Both are in the {ref_genre} genre.",
+            base_explanation,
         )
-
-    result = result.copy()
-    result["explanation"] = result.apply(_explain, axis=1)
+    else:
+        result["explanation"] = base_explanation
 
     preferred_cols = [
         "track_id",
@@ -8,7 +8,8 @@ from typing import Dict, Iterable, List, Optional
 
 import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans
+from joblib import Parallel, delayed
+from sklearn.cluster import MiniBatchKMeans
 from sklearn.metrics import silhouette_score
 
 
@@ -16,6 +17,22 @@ from sklearn.metrics import silhouette_score
 # Clustering evaluation
 # -------------------------------------------------------------------
 
+# Silhouette is O(N^2); scoring a random subsample of this size gives a
+# stable estimate on our ~30k-track matrix at a fraction of the cost.
+_SILHOUETTE_SAMPLE_SIZE = 10_000
+
+
+def _silhouette_for_k(X: np.ndarray, k: int, random_state: int) -> Dict:
+    kmeans = MiniBatchKMeans(n_clusters=k, batch_size=4096, random_state=random_state)
+    labels = kmeans.fit_predict(X)
+    sil = silhouette_score(
+        X,
+        labels,
+        sample_size=min(_SILHOUETTE_SAMPLE_SIZE, len(X)),
+        random_state=random_state,
+    )
+    return {"k": int(k), "silhouette": float(sil)}
+
 
 def compute_silhouette_for_ks(
     X: np.ndarray,
@@ -25,6 +42,10 @@ def compute_silhouette_for_ks(
     """
     Compute silhouette scores for multiple values of k using k-means.
 
+    Uses MiniBatchKMeans plus a subsampled silhouette estimate, and runs
+    the k values in parallel with joblib — the sweep was previously a
+    sequential full-KMeans fit and an O(N^2) silhouette per k.
+
     Args:
         X: 2D numpy array of shape (n_samples, n_features),
            usually the standardized feature matrix (e.g. X_scaled).
@@ -36,14 +57,11 @@ def compute_silhouette_for_ks(
         - 'k'           : number of clusters
         - 'silhouette'  : silhouette score for that k
     """
-    results: List[Dict] = []
     X = np.asarray(X)
 
-    for k in ks:
-        kmeans = KMeans(n_clusters=k, random_state=random_state)
-        labels = kmeans.fit_predict(X)
-        sil = silhouette_score(X, labels)
-        results.append({"k": int(k), "silhouette": float(sil)})
+    results: List[Dict] = Parallel(n_jobs=-1)(
+        delayed(_silhouette_for_k)(X, k, random_state) for k in ks
+    )
 
     return pd.DataFrame(results)
 
@@ -70,14 +88,15 @@ def summarize_clusters(
     if feature_cols is None:
         feature_cols = df_features.select_dtypes(include=["float64", "int64"]).columns.tolist()
 
-    tmp = df_features.copy()
-    tmp["cluster_id"] = labels
-
+    # Group by the external labels array directly — no need to copy the
+    # frame just to attach a cluster_id column.
     cluster_summary = (
-        tmp.groupby("cluster_id")[feature_cols]
+        df_features[feature_cols]
+        .groupby(labels)
         .mean()
         .round(round_digits)
     )
+    cluster_summary.index.name = "cluster_id"
     return cluster_summary
 
 
@@ -161,18 +180,18 @@ def recommendation_diversity_metrics(rec_df: pd.DataFrame) -> Dict[str, float]:
 
     # Artist diversity
     if "track_artist" in rec_df.columns:
-        counts = rec_df["track_artist"].value_counts(normalize=True)
+        _, counts = np.unique(rec_df["track_artist"].to_numpy(), return_counts=True)
+        p = counts / counts.sum()
         # Shannon entropy in bits
-        artist_entropy = float(-np.sum(counts * np.log2(counts)))
-        metrics["artist_entropy"] = artist_entropy
-        metrics["artist_coverage"] = float(rec_df["track_artist"].nunique() / n)
+        metrics["artist_entropy"] = float(-(p * np.log2(p)).sum())
+        metrics["artist_coverage"] = float(len(counts) / n)
 
     # Genre diversity
     if "playlist_genre" in rec_df.columns:
-        g_counts = rec_df["playlist_genre"].value_counts(normalize=True)
-        genre_entropy = float(-np.sum(g_counts * np.log2(g_counts)))
-        metrics["genre_entropy"] = genre_entropy
-        metrics["genre_coverage"] = float(rec_df["playlist_genre"].nunique() / n)
+        _, g_counts = np.unique(rec_df["playlist_genre"].to_numpy(), return_counts=True)
+        g_p = g_counts / g_counts.sum()
+        metrics["genre_entropy"] = float(-(g_p * np.log2(g_p)).sum())
+        metrics["genre_coverage"] = float(len(g_counts) / n)
 
     return metrics
 